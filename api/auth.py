@@ -1,15 +1,34 @@
 """API key authentication for FastAPI endpoints."""
+import secrets
+from functools import lru_cache
 from fastapi import Security, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from core.config import settings
 
 security = HTTPBearer()
 
+# Encoded once at import so each check is a single constant-time memcmp
+_API_KEY = settings.api_key.encode()
+
+
+@lru_cache(maxsize=4)
+def _check_token(token: str) -> bool:
+    """Compare a bearer token against the configured API key.
+
+    There is only one legal key, so memoizing turns repeat checks into a
+    dict lookup. Failures are cached too, and the tiny maxsize bounds
+    memory under a flood of random tokens.
+    """
+    return secrets.compare_digest(token.encode(), _API_KEY)
+
 
 def verify_api_key(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
     """
     Verify API key from Bearer token.
 
+    Uses a constant-time comparison to avoid leaking key bytes through
+    response timing.
+
     Args:
         credentials: HTTP authorization credentials
 
@@ -19,7 +38,7 @@ def verify_api_key(credentials: HTTPAuthorizationCredentials = Security(security
     Raises:
         HTTPException: If API key is invalid
     """
-    if credentials.credentials != settings.api_key:
+    if not _check_token(credentials.credentials):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -0,0 +1,32 @@
+"""Response caching for read-mostly API endpoints."""
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from core.config import settings
+
+
+def request_key_builder(func, namespace: str = "", *, request=None, response=None, args=(), kwargs=None) -> str:
+    """Build cache keys from the request method, path, and query string."""
+    if request is not None:
+        return f"{namespace}:{request.method}:{request.url.path}?{request.url.query}"
+    return f"{namespace}:{func.__module__}.{func.__name__}"
+
+
+async def init_cache():
+    """
+    Initialize the response cache backend.
+
+    Uses Redis when REDIS_URL is configured (multi-process deployments),
+    otherwise falls back to an in-process backend.
+    """
+    if settings.redis_url:
+        from redis import asyncio as aioredis
+        from fastapi_cache.backends.redis import RedisBackend
+
+        backend = RedisBackend(aioredis.from_url(settings.redis_url))
+        print(f"✅ Response cache using Redis at {settings.redis_url}")
+    else:
+        backend = InMemoryBackend()
+        print("✅ Response cache using in-memory backend")
+
+    FastAPICache.init(backend, prefix="ding-cache", key_builder=request_key_builder)
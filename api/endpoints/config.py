@@ -1,10 +1,14 @@
 """Configuration management endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import Dict
+from fastapi_cache import FastAPICache
+from fastapi_cache.decorator import cache
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Tuple
+from datetime import datetime
 from pydantic import BaseModel
 
-from core.database import get_db
+from core.database import get_async_db
 from core.models import AppConfig
 from api.auth import verify_api_key
 
@@ -12,6 +16,34 @@ from api.auth import verify_api_key
 router = APIRouter(prefix="/api/config", tags=["config"])
 
 
+def _config_by_key_stmt(key: str):
+    """Cached statement for fetching a config row by key."""
+    return lambda_stmt(lambda: select(AppConfig).where(AppConfig.key == key))
+
+
+# In-process config cache: the table is tiny and only changes through
+# update_config, so reads become dict lookups with write-through on PUT.
+# Loaded lazily on first read (per worker process). _config_values keeps
+# the plain key -> value mapping precomputed so get_all_config is a
+# single C-level dict copy instead of a per-row comprehension.
+_config_cache: Dict[str, Tuple[str, datetime]] = {}
+_config_values: Dict[str, str] = {}
+_cache_loaded = False
+
+
+async def _ensure_config_cache(db: AsyncSession):
+    """Load the config table into the in-process cache once."""
+    global _cache_loaded
+    if not _cache_loaded:
+        result = await db.execute(
+            select(AppConfig.key, AppConfig.value, AppConfig.updated_at)
+        )
+        for key, value, updated_at in result.all():
+            _config_cache[key] = (value, updated_at)
+            _config_values[key] = value
+        _cache_loaded = True
+
+
 # Pydantic schemas
 class ConfigUpdate(BaseModel):
     value: str
@@ -20,52 +52,57 @@ class ConfigUpdate(BaseModel):
 class ConfigResponse(BaseModel):
     key: str
     value: str
-    updated_at: str
+    updated_at: datetime
 
     class Config:
         from_attributes = True
 
 
 @router.get("", response_model=Dict[str, str])
-def get_all_config(
-    db: Session = Depends(get_db),
+@cache(expire=10, namespace="config")
+async def get_all_config(
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Get all configuration parameters."""
-    configs = db.query(AppConfig).all()
-    return {config.key: config.value for config in configs}
+    await _ensure_config_cache(db)
+    return dict(_config_values)
 
 
 @router.get("/{key}", response_model=ConfigResponse)
-def get_config(
+@cache(expire=30, namespace="config")
+async def get_config(
     key: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Get specific configuration value by key."""
-    config = db.query(AppConfig).filter(AppConfig.key == key).first()
-    if not config:
+    await _ensure_config_cache(db)
+    entry = _config_cache.get(key)
+    if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Configuration key '{key}' not found"
         )
 
+    value, updated_at = entry
     return ConfigResponse(
-        key=config.key,
-        value=config.value,
-        updated_at=config.updated_at.isoformat()
+        key=key,
+        value=value,
+        updated_at=updated_at
     )
 
 
 @router.put("/{key}", response_model=ConfigResponse)
-def update_config(
+async def update_config(
     key: str,
     config_update: ConfigUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Update configuration value."""
-    config = db.query(AppConfig).filter(AppConfig.key == key).first()
+    result = await db.execute(_config_by_key_stmt(key))
+    config = result.scalar_one_or_none()
     if not config:
         # Create new config if doesn't exist
         config = AppConfig(key=key, value=config_update.value)
@@ -73,11 +110,17 @@ def update_config(
     else:
         config.value = config_update.value
 
-    db.commit()
-    db.refresh(config)
+    await db.commit()
+    await db.refresh(config)
+
+    # Write through to the in-process cache and drop cached responses so
+    # readers see the new value
+    _config_cache[config.key] = (config.value, config.updated_at)
+    _config_values[config.key] = config.value
+    await FastAPICache.clear(namespace="config")
 
     return ConfigResponse(
         key=config.key,
         value=config.value,
-        updated_at=config.updated_at.isoformat()
+        updated_at=config.updated_at
     )
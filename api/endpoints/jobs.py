@@ -1,13 +1,15 @@
 """Job management endpoints."""
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 from pathlib import Path
 
-from core.database import get_db
+from core.database import get_async_db
 from core.models import DingJob, User
 from api.auth import verify_api_key
 from services.printer import printer_service
@@ -28,76 +30,111 @@ class JobResponse(BaseModel):
     font_size: Optional[str]
     status: str
     error_message: Optional[str]
-    created_at: str
-    completed_at: Optional[str]
+    created_at: datetime
+    completed_at: Optional[datetime]
 
     class Config:
         from_attributes = True
 
 
-@router.get("", response_model=List[JobResponse])
-def get_jobs(
+class JobListResponse(BaseModel):
+    items: List[JobResponse]
+    next_cursor: Optional[int]
+
+
+def _job_by_id_stmt(job_id: int):
+    """Statement for fetching a job with its user by id.
+
+    lambda_stmt caches the compiled SQL across calls and only rebinds
+    the job_id parameter.
+    """
+    return lambda_stmt(
+        lambda: select(DingJob).options(joinedload(DingJob.user)).where(DingJob.id == job_id)
+    )
+
+
+@router.get("", response_model=JobListResponse)
+async def get_jobs(
     username: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     status: Optional[str] = None,
-    db: Session = Depends(get_db),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """
-    Query printer jobs with optional filters.
+    Query printer jobs with optional filters, newest first.
+
+    Results are paginated with a keyset cursor: pass the returned
+    next_cursor back as `cursor` to fetch the next page.
 
     Args:
         username: Filter by username
         start_date: Filter by start date (ISO 8601)
         end_date: Filter by end date (ISO 8601)
         status: Filter by status (pending, processing, success, failed)
+        limit: Maximum jobs per page
+        cursor: Return jobs with id below this value (from next_cursor)
     """
-    query = db.query(DingJob).join(User)
+    # Select only the response columns as lightweight tuples instead of
+    # hydrating full ORM instances; the join also brings back usernames
+    # in the same SELECT
+    query = select(
+        DingJob.id,
+        DingJob.user_id,
+        User.username,
+        DingJob.job_type,
+        DingJob.content_type,
+        DingJob.text_content,
+        DingJob.image_path,
+        DingJob.font_size,
+        DingJob.status,
+        DingJob.error_message,
+        DingJob.created_at,
+        DingJob.completed_at
+    ).join(User)
 
     # Apply filters
     if username:
-        query = query.filter(User.username == username)
+        query = query.where(User.username == username)
 
     if start_date:
-        query = query.filter(DingJob.created_at >= start_date)
+        query = query.where(DingJob.created_at >= start_date)
 
     if end_date:
-        query = query.filter(DingJob.created_at <= end_date)
+        query = query.where(DingJob.created_at <= end_date)
 
     if status:
-        query = query.filter(DingJob.status == status)
-
-    # Order by created_at descending
-    jobs = query.order_by(DingJob.created_at.desc()).all()
-
-    return [
-        JobResponse(
-            id=job.id,
-            user_id=job.user_id,
-            username=job.user.username,
-            job_type=job.job_type,
-            content_type=job.content_type,
-            text_content=job.text_content,
-            image_path=job.image_path,
-            font_size=job.font_size,
-            status=job.status,
-            error_message=job.error_message,
-            created_at=job.created_at.isoformat(),
-            completed_at=job.completed_at.isoformat() if job.completed_at else None
-        )
-        for job in jobs
-    ]
+        query = query.where(DingJob.status == status)
+
+    # Keyset pagination: seeking on id beats OFFSET since it's an index
+    # seek instead of skipping N rows (id order matches creation order)
+    if cursor:
+        query = query.where(DingJob.id < cursor)
+
+    # Newest first; the Row tuples carry all response fields by name, so
+    # FastAPI serializes them in a single pass via the response_model
+    # instead of a per-row manual copy here
+    result = await db.execute(query.order_by(DingJob.id.desc()).limit(limit))
+    items = result.all()
+
+    return JobListResponse(
+        items=items,
+        next_cursor=items[-1].id if len(items) == limit else None
+    )
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-def get_job(
+async def get_job(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Get job details by ID."""
-    job = db.query(DingJob).filter(DingJob.id == job_id).first()
+    result = await db.execute(_job_by_id_stmt(job_id))
+    job = result.scalar_one_or_none()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -115,19 +152,21 @@ def get_job(
         font_size=job.font_size,
         status=job.status,
         error_message=job.error_message,
-        created_at=job.created_at.isoformat(),
-        completed_at=job.completed_at.isoformat() if job.completed_at else None
+        created_at=job.created_at,
+        completed_at=job.completed_at
     )
 
 
 @router.get("/{job_id}/image")
-def download_job_image(
+async def download_job_image(
     job_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Download the image file associated with a job."""
-    job = db.query(DingJob).filter(DingJob.id == job_id).first()
+    result = await db.execute(_job_by_id_stmt(job_id))
+    job = result.scalar_one_or_none()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -147,21 +186,33 @@ def download_job_image(
             detail="Image file not found"
         )
 
+    # Weak ETag from mtime + size short-circuits repeat downloads with a
+    # bodyless 304; full responses go out via FileResponse's sendfile path
+    stat = image_path.stat()
+    etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag}
+        )
+
     return FileResponse(
         path=str(image_path),
         media_type="image/jpeg",
-        filename=image_path.name
+        filename=image_path.name,
+        headers={"ETag": etag, "Cache-Control": "private, max-age=300"}
     )
 
 
 @router.post("/{job_id}/retry", response_model=JobResponse)
-def retry_job(
+async def retry_job(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Retry a failed job."""
-    job = db.query(DingJob).filter(DingJob.id == job_id).first()
+    result = await db.execute(_job_by_id_stmt(job_id))
+    job = result.scalar_one_or_none()
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -178,12 +229,12 @@ def retry_job(
     job.status = "pending"
     job.error_message = None
     job.completed_at = None
-    db.commit()
+    await db.commit()
 
     # Process job asynchronously
     printer_service.process_job_async(job_id)
 
-    db.refresh(job)
+    await db.refresh(job)
 
     return JobResponse(
         id=job.id,
@@ -196,6 +247,6 @@ def retry_job(
         font_size=job.font_size,
         status=job.status,
         error_message=job.error_message,
-        created_at=job.created_at.isoformat(),
-        completed_at=job.completed_at.isoformat() if job.completed_at else None
+        created_at=job.created_at,
+        completed_at=job.completed_at
     )
@@ -1,10 +1,12 @@
 """User management endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from datetime import datetime
 from pydantic import BaseModel, EmailStr
 
-from core.database import get_db
+from core.database import get_async_db
 from core.models import User
 from api.auth import verify_api_key
 
@@ -12,6 +14,20 @@ from api.auth import verify_api_key
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 
+def _user_by_id_stmt(user_id: int):
+    """Cached statement for fetching a user by id (only rebinds user_id)."""
+    return lambda_stmt(lambda: select(User).where(User.id == user_id))
+
+
+def _username_exists_stmt(username: str):
+    """Cached EXISTS statement for the username uniqueness check.
+
+    SELECT 1 ... EXISTS avoids fetching and hydrating a full user row
+    just to test presence.
+    """
+    return lambda_stmt(lambda: select(exists().where(User.username == username)))
+
+
 # Pydantic schemas
 class UserCreate(BaseModel):
     username: str
@@ -29,23 +45,23 @@ class UserResponse(BaseModel):
     username: str
     email: str
     is_active: bool
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
 
 
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def create_user(
+async def create_user(
     user: UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Create a new user."""
     # Check if username already exists
-    existing_user = db.query(User).filter(User.username == user.username).first()
-    if existing_user:
+    result = await db.execute(_username_exists_stmt(user.username))
+    if result.scalar():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already exists"
@@ -57,50 +73,53 @@ def create_user(
         email=user.email
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
 
     return UserResponse(
         id=db_user.id,
         username=db_user.username,
         email=db_user.email,
         is_active=db_user.is_active,
-        created_at=db_user.created_at.isoformat(),
-        updated_at=db_user.updated_at.isoformat()
+        created_at=db_user.created_at,
+        updated_at=db_user.updated_at
     )
 
 
 @router.get("", response_model=List[UserResponse])
-def list_users(
+async def list_users(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """List all users with pagination."""
-    users = db.query(User).offset(skip).limit(limit).all()
-
-    return [
-        UserResponse(
-            id=u.id,
-            username=u.username,
-            email=u.email,
-            is_active=u.is_active,
-            created_at=u.created_at.isoformat(),
-            updated_at=u.updated_at.isoformat()
-        )
-        for u in users
-    ]
+    # Select only the response columns as lightweight tuples instead of
+    # hydrating full ORM instances
+    result = await db.execute(
+        select(
+            User.id,
+            User.username,
+            User.email,
+            User.is_active,
+            User.created_at,
+            User.updated_at
+        ).offset(skip).limit(limit)
+    )
+    # Row tuples carry all response fields by name, so FastAPI serializes
+    # them in a single pass via the response_model
+    return result.all()
 
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(
+async def get_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Get user by ID."""
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(_user_by_id_stmt(user_id))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -112,20 +131,21 @@ def get_user(
         username=user.username,
         email=user.email,
         is_active=user.is_active,
-        created_at=user.created_at.isoformat(),
-        updated_at=user.updated_at.isoformat()
+        created_at=user.created_at,
+        updated_at=user.updated_at
     )
 
 
 @router.put("/{user_id}", response_model=UserResponse)
-def update_user(
+async def update_user(
     user_id: int,
     user_update: UserUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Update user information."""
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(_user_by_id_stmt(user_id))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -134,8 +154,8 @@ def update_user(
 
     # Check if new username conflicts
     if user_update.username and user_update.username != user.username:
-        existing = db.query(User).filter(User.username == user_update.username).first()
-        if existing:
+        result = await db.execute(_username_exists_stmt(user_update.username))
+        if result.scalar():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already exists"
@@ -148,34 +168,35 @@ def update_user(
     if user_update.is_active is not None:
         user.is_active = user_update.is_active
 
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return UserResponse(
         id=user.id,
         username=user.username,
         email=user.email,
         is_active=user.is_active,
-        created_at=user.created_at.isoformat(),
-        updated_at=user.updated_at.isoformat()
+        created_at=user.created_at,
+        updated_at=user.updated_at
     )
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
+async def delete_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _: str = Depends(verify_api_key)
 ):
     """Delete a user."""
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(_user_by_id_stmt(user_id))
+    user = result.scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
 
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
 
     return None
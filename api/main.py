@@ -1,16 +1,19 @@
 """Main FastAPI application for DING REST API."""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
 
+from api.cache import init_cache
 from api.endpoints import users, config, jobs
-from core.database import init_db, init_default_config
 
 
 # Create FastAPI app
 app = FastAPI(
     title="DING API",
     description="REST API for DING - Retro Receipt Printer Web Interface",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -29,20 +32,24 @@ app.include_router(jobs.router)
 
 
 @app.on_event("startup")
-def startup_event():
-    """Initialize database on startup."""
-    init_db()
-    init_default_config()
+async def startup_event():
+    """Initialize response cache on startup.
+
+    Schema creation and config seeding happen once at deploy time via
+    `python -m core.database` (see setup.sh), not per worker boot.
+    """
+    await init_cache()
 
 
 @app.get("/health")
-def health_check():
+@cache(expire=10)
+async def health_check():
     """Health check endpoint."""
     return {"status": "ok", "message": "DING API is running"}
 
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint."""
     return {
         "message": "Welcome to DING API",
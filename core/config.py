@@ -1,6 +1,7 @@
 """Application configuration using pydantic-settings."""
 import os
 from pathlib import Path
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +14,14 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./ding.db"
 
+    # Connection pool tuning (ignored for SQLite)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+
+    # Response cache (falls back to in-memory when unset)
+    redis_url: Optional[str] = None
+
     # SendGrid
     sendgrid_api_key: str
     sendgrid_from_email: str
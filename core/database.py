@@ -1,19 +1,76 @@
 """Database session management and initialization."""
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from core.config import settings
 from core.models import Base
 
 
-# Create database engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
-)
-
-# Create session factory
+def _async_database_url(url: str) -> str:
+    """Translate a sync database URL to its async driver equivalent."""
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+def _engine_kwargs() -> dict:
+    """Build engine keyword arguments for the configured database."""
+    if "sqlite" in settings.database_url:
+        return {"connect_args": {"check_same_thread": False}}
+    # Explicit pool sizing avoids connection-acquire stalls under
+    # concurrent traffic; pre_ping drops dead connections before use
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": True,
+    }
+
+
+def _async_engine_kwargs() -> dict:
+    """Build engine keyword arguments for the async engine."""
+    kwargs = _engine_kwargs()
+    # aiosqlite manages its own connection thread
+    kwargs.pop("connect_args", None)
+    return kwargs
+
+
+# Create database engine (sync; used by the Streamlit UI and printer threads)
+engine = create_engine(settings.database_url, **_engine_kwargs())
+
+# Async engine for FastAPI endpoints (runs on the event loop instead of
+# the request threadpool)
+async_engine = create_async_engine(_async_database_url(settings.database_url), **_async_engine_kwargs())
+
+if "sqlite" in settings.database_url:
+    # WAL lets readers run alongside the single writer instead of
+    # serializing on the rollback journal; the remaining pragmas trade
+    # durability-on-power-loss for far fewer fsyncs and disk reads
+    _SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA foreign_keys=ON",
+    )
+
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        cursor = dbapi_conn.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autocommit=False, autoflush=False, expire_on_commit=False
+)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -25,6 +82,12 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database sessions (one per request)."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
@@ -32,17 +95,16 @@ def init_db():
 
 
 def init_default_config():
-    """Initialize default configuration parameters."""
+    """Initialize default configuration parameters.
+
+    Idempotent and race-safe: seeding uses INSERT ... ON CONFLICT DO
+    NOTHING, so concurrent initializers (or repeat runs) leave existing
+    values untouched.
+    """
     from core.models import AppConfig
 
     db = SessionLocal()
     try:
-        # Check if config already exists
-        existing_config = db.query(AppConfig).first()
-        if existing_config:
-            print("⚠️  Configuration already exists, skipping initialization")
-            return
-
         default_configs = {
             # Session & Authentication
             "session_timeout_minutes": "180",
@@ -67,10 +129,15 @@ def init_default_config():
             "cowsay_chars_per_line_large": "20",
         }
 
-        for key, value in default_configs.items():
-            config = AppConfig(key=key, value=value)
-            db.add(config)
+        # Single multi-row INSERT; existing keys are skipped so only one
+        # initializer wins without a prior existence check
+        if engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
 
+        rows = [{"key": key, "value": value} for key, value in default_configs.items()]
+        db.execute(insert(AppConfig).values(rows).on_conflict_do_nothing())
         db.commit()
         print(f"✅ Initialized {len(default_configs)} default configuration parameters")
 
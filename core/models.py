@@ -1,6 +1,6 @@
 """SQLAlchemy database models for DING application."""
 from datetime import datetime
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -40,7 +40,9 @@ class AuthPin(Base):
     used = Column(Boolean, default=False, nullable=False)
 
     # Relationships
-    user = relationship("User", back_populates="auth_pins")
+    # Many-to-one sides are lazy="joined" so the parent user comes back in
+    # the same SELECT instead of a lazy query per access
+    user = relationship("User", back_populates="auth_pins", lazy="joined")
 
     def __repr__(self):
         return f"<AuthPin(id={self.id}, user_id={self.user_id}, used={self.used})>"
@@ -59,7 +61,7 @@ class UserSession(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
-    user = relationship("User", back_populates="session")
+    user = relationship("User", back_populates="session", lazy="joined")
 
     def __repr__(self):
         return f"<UserSession(id={self.id}, user_id={self.user_id})>"
@@ -83,20 +85,31 @@ class DingJob(Base):
 
     __tablename__ = "ding_jobs"
 
+    # Composite indexes serve the common filter + ORDER BY created_at DESC
+    # list queries without a separate sort; they also cover the old
+    # single-column lookups on user_id, status, and created_at.
+    # (user_id, created_at) in particular turns the per-user recent-jobs
+    # lookup into a bounded index range scan
+    __table_args__ = (
+        Index("ix_ding_jobs_user_created", "user_id", "created_at"),
+        Index("ix_ding_jobs_status_created", "status", "created_at"),
+        Index("ix_ding_jobs_created_at", "created_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     job_type = Column(String(50), nullable=False)  # text, image, text_with_image
     content_type = Column(String(50), nullable=False)  # plain, cowsay, banner
     text_content = Column(Text, nullable=True)
     image_path = Column(String(500), nullable=True)
     font_size = Column(String(20), nullable=True)  # small, medium, large
-    status = Column(String(20), default="pending", nullable=False, index=True)  # pending, processing, success, failed
+    status = Column(String(20), default="pending", nullable=False)  # pending, processing, success, failed
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
 
     # Relationships
-    user = relationship("User", back_populates="jobs")
+    user = relationship("User", back_populates="jobs", lazy="joined")
 
     def __repr__(self):
         return f"<DingJob(id={self.id}, type='{self.job_type}', status='{self.status}')>"
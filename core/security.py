@@ -29,17 +29,18 @@ def create_pin_for_user(db: Session, user_id: int, expiry_minutes: int = 10) ->
     Returns:
         The generated PIN
     """
-    # Invalidate all previous unused PINs for this user
+    # Invalidate all previous unused PINs for this user; the session has
+    # no loaded AuthPin instances here, so skip the synchronization pass
     db.query(AuthPin).filter(
         AuthPin.user_id == user_id,
         AuthPin.used == False
-    ).update({"used": True})
+    ).update({"used": True}, synchronize_session=False)
 
     # Generate new PIN
     pin = generate_pin()
     expires_at = datetime.utcnow() + timedelta(minutes=expiry_minutes)
 
-    # Create PIN record
+    # Create PIN record (no refresh needed: only the PIN itself is returned)
     auth_pin = AuthPin(
         user_id=user_id,
         pin=pin,
@@ -48,7 +49,6 @@ def create_pin_for_user(db: Session, user_id: int, expiry_minutes: int = 10) ->
     )
     db.add(auth_pin)
     db.commit()
-    db.refresh(auth_pin)
 
     return pin
 
@@ -130,13 +130,13 @@ def create_session(db: Session, user_id: int, timeout_minutes: int = 180) -> str
         Session token
     """
     # Delete existing session for this user
-    db.query(UserSession).filter(UserSession.user_id == user_id).delete()
+    db.query(UserSession).filter(UserSession.user_id == user_id).delete(synchronize_session=False)
 
     # Generate session token
     session_token = generate_session_token()
     expires_at = datetime.utcnow() + timedelta(minutes=timeout_minutes)
 
-    # Create session
+    # Create session (no refresh needed: only the token is returned)
     session = UserSession(
         user_id=user_id,
         session_token=session_token,
@@ -145,7 +145,6 @@ def create_session(db: Session, user_id: int, timeout_minutes: int = 180) -> str
     )
     db.add(session)
     db.commit()
-    db.refresh(session)
 
     return session_token
 
@@ -163,6 +162,31 @@ def validate_session(db: Session, session_token: str, extend: bool = True, timeo
     Returns:
         User object if session is valid, None otherwise
     """
+    validated = validate_session_with_expiry(db, session_token, extend, timeout_minutes)
+    return validated[0] if validated else None
+
+
+def validate_session_with_expiry(
+    db: Session,
+    session_token: str,
+    extend: bool = True,
+    timeout_minutes: int = 180
+) -> Optional[tuple]:
+    """
+    Validate a session token and return the user plus the expiry time.
+
+    The expiry is already loaded (and possibly just extended) here, so
+    callers that also display it avoid a second session lookup.
+
+    Args:
+        db: Database session
+        session_token: Session token to validate
+        extend: Whether to extend session on activity
+        timeout_minutes: Session timeout in minutes (for extension)
+
+    Returns:
+        (User, expires_at) tuple if session is valid, None otherwise
+    """
     # Get session
     session = db.query(UserSession).filter(
         UserSession.session_token == session_token,
@@ -187,7 +211,7 @@ def validate_session(db: Session, session_token: str, extend: bool = True, timeo
         session.expires_at = datetime.utcnow() + timedelta(minutes=timeout_minutes)
         db.commit()
 
-    return user
+    return user, session.expires_at
 
 
 def delete_session(db: Session, session_token: str):
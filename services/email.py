@@ -1,8 +1,19 @@
 """Email service using SendGrid for PIN delivery."""
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Email, To, Content
 from core.config import settings
 
+# Client is built lazily on first send so processes that never email
+# (printer worker, image service) skip the sendgrid import entirely
+_client = None
+
+
+def _get_client():
+    """Get a cached SendGrid client, importing the library on first use."""
+    global _client
+    if _client is None:
+        from sendgrid import SendGridAPIClient
+        _client = SendGridAPIClient(settings.sendgrid_api_key)
+    return _client
+
 
 def send_pin_email(email: str, pin: str, username: str) -> bool:
     """
@@ -17,6 +28,8 @@ def send_pin_email(email: str, pin: str, username: str) -> bool:
         True if email sent successfully, False otherwise
     """
     try:
+        from sendgrid.helpers.mail import Mail, Email, To, Content
+
         # ASCII art email body with retro styling
         email_body = f"""
 ╔═══════════════════════════════════════╗
@@ -56,7 +69,7 @@ Happy dinging! 🎉
         )
 
         # Send email
-        sg = SendGridAPIClient(settings.sendgrid_api_key)
+        sg = _get_client()
         response = sg.send(message)
 
         # Check response
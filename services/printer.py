@@ -1,7 +1,7 @@
 """Printer service for ESC/POS thermal printer integration."""
+import os
 import threading
 from datetime import datetime
-from pathlib import Path
 from typing import Optional
 from sqlalchemy.orm import Session
 
@@ -19,19 +19,61 @@ from services.text_renderer import render_text_banner
 class PrinterService:
     """Service for managing thermal printer operations."""
 
+    # ESC/POS GS ! n reset sequence (1x1)
+    _FONT_RESET = b'\x1d\x21\x00'
+
+    # ESC/POS GS V 0 full paper cut
+    _CUT = b'\x1d\x56\x00'
+
+    # Upper bound on remembered job results; results the UI never
+    # consumes (API retries, abandoned sessions) are evicted oldest-first
+    _MAX_JOB_RESULTS = 128
+
     def __init__(self):
         """Initialize printer service."""
         self._lock = threading.Lock()
+        # Cached printer connection; USB open costs O(100ms) per job and
+        # access is already serialized by the lock
+        self._printer = None
+        # Terminal results of jobs processed in this process, keyed by
+        # job id; lets the UI read status without polling the DB
+        self._job_results = {}
+        # Precompiled reset + size byte sequence per font size, so
+        # _set_font_size is one _raw write with no config lookups
+        self._font_bytes = {}
+        for font_size in ("small", "medium", "large"):
+            width = yaml_config.get_int(f"fonts.{font_size}.width", 1)
+            height = yaml_config.get_int(f"fonts.{font_size}.height", 1)
+            # ESC/POS GS ! n command: width and height from 0-7 (representing 1-8x)
+            # Bit 0-2: width-1, Bit 4-6: height-1
+            size_byte = ((width - 1) << 4) | (height - 1)
+            self._font_bytes[font_size] = (
+                self._FONT_RESET + b'\x1d\x21' + bytes([size_byte]),
+                f"{width}x{height}"
+            )
 
     def _connect_printer(self):
         """
         Connect to ESC/POS printer.
-        Tries USB connection first, then falls back to file device.
-        Always creates a fresh connection to avoid stale connections.
+        Reuses the cached connection when a probe write succeeds;
+        otherwise tries USB connection first, then falls back to file
+        device.
 
         Returns:
             Printer object (Usb or File)
         """
+        if self._printer is not None:
+            try:
+                # Real liveness probe: write ESC @ (initialize) to the
+                # device. python-escpos's is_usable() is only a static
+                # dependency check and never notices a dead handle, so an
+                # actual write is needed to detect unplug/replug.
+                self._printer.hw('INIT')
+                return self._printer
+            except Exception:
+                # Stale connection: close and reopen below
+                self._drop_printer()
+
         try:
             # Parse hex vendor and product IDs
             vendor_id = int(settings.printer_vendor_id, 16)
@@ -40,6 +82,7 @@ class PrinterService:
             # Try USB connection
             printer = Usb(vendor_id, product_id)
             print(f"✅ Connected to printer via USB ({settings.printer_vendor_id}:{settings.printer_product_id})")
+            self._printer = printer
             return printer
 
         except Exception as e:
@@ -49,19 +92,63 @@ class PrinterService:
                 # Fallback to file device
                 printer = PrinterFile(settings.printer_device_path)
                 print(f"✅ Connected to printer via file device ({settings.printer_device_path})")
+                self._printer = printer
                 return printer
 
             except Exception as e2:
                 print(f"❌ File device connection failed: {e2}")
                 raise ConnectionError(f"Failed to connect to printer: USB failed ({e}), File failed ({e2})")
 
-    def _close_printer(self, printer):
+    def _reset_after_fork(self):
         """
-        Close printer connection and release resources.
+        Drop state inherited by a forked child (e.g. uvicorn workers).
 
-        Args:
-            printer: Printer object to close
+        The cached USB handle still belongs to the parent and the lock
+        may have been held mid-print at fork time, so the child gets a
+        fresh lock and reconnects on its first job. The handle is only
+        dereferenced, never closed, to leave the parent's connection
+        untouched.
+        """
+        self._lock = threading.Lock()
+        self._printer = None
+        self._job_results.clear()
+
+    def _record_job_result(self, job_id: int, status: str, error_message=None):
+        """
+        Record a job result, evicting the oldest entries beyond the cap.
+
+        Keeps the dict bounded in processes where nothing consumes the
+        results (e.g. the API worker servicing retries); readers that
+        miss an evicted entry fall back to the DB.
         """
+        results = self._job_results
+        results.pop(job_id, None)
+        results[job_id] = (status, error_message)
+        while len(results) > self._MAX_JOB_RESULTS:
+            results.pop(next(iter(results)))
+
+    def get_job_result(self, job_id: int):
+        """
+        Return (status, error_message) for a job handled in this process.
+
+        Returns None when the job is unknown here (e.g. it was printed
+        by another process), in which case callers fall back to the DB.
+        """
+        return self._job_results.get(job_id)
+
+    def clear_job_result(self, job_id: int):
+        """Forget a job's in-memory result once it has been consumed."""
+        self._job_results.pop(job_id, None)
+
+    def _drop_printer(self):
+        """
+        Close the cached printer connection and release resources.
+
+        Called on I/O errors (and stale connections) so the next job
+        reconnects fresh; successful jobs keep the connection open.
+        """
+        printer = self._printer
+        self._printer = None
         try:
             if printer:
                 printer.close()
@@ -69,23 +156,25 @@ class PrinterService:
         except Exception as e:
             print(f"  ⚠️  Error closing printer: {e}")
 
+    def _feed_before_bytes(self) -> bytes:
+        """Bytes feeding the configured number of lines before content."""
+        return b'\n' * yaml_config.get_int("printer.feed_before_lines", 1)
+
+    def _feed_and_cut_bytes(self) -> bytes:
+        """Bytes applying feed_after and cut_paper settings from YAML."""
+        tail = b'\n' * yaml_config.get_int("printer.feed_after_lines", 3)
+        if yaml_config.get_bool("printer.cut_paper", True):
+            tail += self._CUT
+        return tail
+
     def _feed_and_cut(self, printer):
         """
-        Apply feed_before, feed_after, and cut_paper settings from YAML.
+        Apply feed_after and cut_paper settings in a single write.
 
         Args:
             printer: Printer object to use
         """
-        feed_after = yaml_config.get_int("printer.feed_after_lines", 3)
-        cut_paper = yaml_config.get_bool("printer.cut_paper", True)
-
-        # Feed after content
-        for _ in range(feed_after):
-            printer.text("\n")
-
-        # Cut paper if configured
-        if cut_paper:
-            printer.cut()
+        printer._raw(self._feed_and_cut_bytes())
 
     def _get_font_size_config(self, font_size: str, is_cowsay: bool = False) -> int:
         """Get character limit for font size from YAML."""
@@ -95,24 +184,17 @@ class PrinterService:
 
     def _set_font_size(self, printer, font_size: str):
         """
-        Set ESC/POS font size using YAML configuration.
+        Set ESC/POS font size using the precompiled byte table.
+
+        The sequence always resets to 1x1 first to ensure clean state.
 
         Args:
             printer: Printer object to use
             font_size: Font size name (small/medium/large)
         """
-        width = yaml_config.get_int(f"fonts.{font_size}.width", 1)
-        height = yaml_config.get_int(f"fonts.{font_size}.height", 1)
-
-        # ALWAYS reset first to ensure clean state
-        printer._raw(b'\x1d\x21\x00')  # Reset to normal (1x1)
-
-        # ESC/POS GS ! n command: width and height from 0-7 (representing 1-8x)
-        # Bit 0-2: width-1, Bit 4-6: height-1
-        size_byte = ((width - 1) << 4) | (height - 1)
-        printer._raw(b'\x1d\x21' + bytes([size_byte]))
-
-        print(f"  📏 Set font size: {font_size} ({width}x{height})")
+        raw, dimensions = self._font_bytes[font_size]
+        printer._raw(raw)
+        print(f"  📏 Set font size: {font_size} ({dimensions})")
 
     def _reset_font_size(self, printer):
         """
@@ -121,7 +203,7 @@ class PrinterService:
         Args:
             printer: Printer object to use
         """
-        printer._raw(b'\x1d\x21\x00')  # Reset to 1x1
+        printer._raw(self._FONT_RESET)  # Reset to 1x1
         print(f"  📏 Reset font to normal")
 
     def print_text(
@@ -142,48 +224,41 @@ class PrinterService:
             font_size: Font size (small/medium/large/banner)
             use_cowsay: Whether to use cowsay format
         """
-        printer = None
         try:
             # Banner mode: render text as image
             if font_size == "banner":
                 self._print_text_banner(db, job_id, text)
                 return
 
-            # Regular text printing
-            # Connect to printer (fresh connection each time)
+            # Regular text printing (reuses the cached connection)
             printer = self._connect_printer()
 
-            # Feed before
-            feed_before = yaml_config.get_int("printer.feed_before_lines", 1)
-            for _ in range(feed_before):
-                printer.text("\n")
-
             # Get character limit for font size
             max_width = self._get_font_size_config(font_size, use_cowsay)
 
-            # Prepare text
+            # Prepare text (ASCII after encode_for_escpos)
             prepared_text = prepare_text_for_print(text, max_width, use_cowsay)
 
-            # Set font size
-            self._set_font_size(printer, font_size)
-
-            # Print text
-            printer.text(prepared_text)
-            printer.text("\n")
-
-            # Reset font size
-            self._reset_font_size(printer)
-
-            # Feed and cut
-            self._feed_and_cut(printer)
-
+            # Coalesce the whole job — feed, font set, text, font reset,
+            # feed and cut — into one _raw write instead of a dozen
+            # USB/file transfers
+            font_bytes, dimensions = self._font_bytes[font_size]
+            buf = bytearray()
+            buf += self._feed_before_bytes()
+            buf += font_bytes
+            buf += prepared_text.encode('ascii', errors='replace')
+            buf += b'\n'
+            buf += self._FONT_RESET
+            buf += self._feed_and_cut_bytes()
+            printer._raw(bytes(buf))
+
+            print(f"  📏 Set font size: {font_size} ({dimensions})")
             print(f"✅ Printed text job {job_id} (font: {font_size})")
 
         except Exception as e:
+            # Drop the cached connection so the next job reconnects fresh
+            self._drop_printer()
             raise Exception(f"Error printing text: {e}")
-        finally:
-            # Always close the printer connection
-            self._close_printer(printer)
 
     def _print_text_banner(self, db: Session, job_id: int, text: str):
         """
@@ -194,49 +269,39 @@ class PrinterService:
             job_id: Job ID
             text: Text to print as banner
         """
-        printer = None
         try:
             # Get printer width
             dots_per_line = yaml_config.get_int("printer.dots_per_line", 384)
 
-            # Render text to horizontal image
-            temp_path = str(Path(settings.store_path) / f"banner_temp_{job_id}.png")
-            render_text_banner(text, temp_path, dots_per_line)
-
-            # Process image: rotate 90° counterclockwise
-            processed_path = str(Path(settings.store_path) / f"banner_{job_id}.png")
+            # Render and rotate entirely in memory; nothing touches disk
+            # until after the print succeeds
             from PIL import Image
-            img = Image.open(temp_path)
+            img = render_text_banner(text, dots_per_line=dots_per_line)
             img = img.transpose(Image.Transpose.ROTATE_90)
-            img.save(processed_path)
 
             print(f"  🔄 Rotated banner 90° counterclockwise")
 
-            # Print as image (fresh connection)
+            # Print as image (reuses the cached connection)
             printer = self._connect_printer()
 
-            # Feed before
-            feed_before = yaml_config.get_int("printer.feed_before_lines", 1)
-            for _ in range(feed_before):
-                printer.text("\n")
+            # Feed before (single write)
+            printer._raw(self._feed_before_bytes())
 
-            # Print the rotated banner image
-            printer.image(processed_path)
+            # Print the rotated banner image straight from memory
+            printer.image(img)
 
             # Feed and cut
             self._feed_and_cut(printer)
 
             print(f"✅ Printed banner job {job_id}")
 
-            # Clean up temp files
-            Path(temp_path).unlink(missing_ok=True)
-            # Keep processed_path for retry functionality
+            # Persist the rotated banner for retry, after the print is out
+            img.save(f"{settings.store_path}/banner_{job_id}.png")
 
         except Exception as e:
+            # Drop the cached connection so the next job reconnects fresh
+            self._drop_printer()
             raise Exception(f"Error printing banner: {e}")
-        finally:
-            # Always close the printer connection
-            self._close_printer(printer)
 
     def print_image(
         self,
@@ -258,25 +323,23 @@ class PrinterService:
             font_size: Font size for caption
             is_banner: Whether to rotate image for banner mode
         """
-        printer = None
         try:
-            # Connect to printer (fresh connection)
+            # Connect to printer (reuses the cached connection)
             printer = self._connect_printer()
 
-            # Feed before
-            feed_before = yaml_config.get_int("printer.feed_before_lines", 1)
-            for _ in range(feed_before):
-                printer.text("\n")
+            # Feed before (single write)
+            printer._raw(self._feed_before_bytes())
 
             # Process image
             max_width = yaml_config.get_int("printer.dots_per_line", 384)
-            processed_path = str(Path(image_path).parent / f"processed_{Path(image_path).name}")
+            processed_path = f"{os.path.dirname(image_path)}/processed_{os.path.basename(image_path)}"
 
             process_image(
                 image_path=image_path,
                 output_path=processed_path,
                 max_width=max_width,
-                rotate=is_banner
+                rotate=is_banner,
+                dither=yaml_config.get_bool("printer.dither", True)
             )
 
             # Print image
@@ -301,10 +364,9 @@ class PrinterService:
             print(f"✅ Printed image job {job_id}")
 
         except Exception as e:
+            # Drop the cached connection so the next job reconnects fresh
+            self._drop_printer()
             raise Exception(f"Error printing image: {e}")
-        finally:
-            # Always close the printer connection
-            self._close_printer(printer)
 
     def process_job(self, job_id: int):
         """
@@ -318,12 +380,16 @@ class PrinterService:
         try:
             # Acquire lock to prevent concurrent printing
             with self._lock:
-                # Get job
-                job = db.query(DingJob).filter(DingJob.id == job_id).first()
+                # Get job (single SELECT via the identity-map get)
+                job = db.get(DingJob, job_id)
                 if not job:
                     raise ValueError(f"Job {job_id} not found")
 
-                # Update status to processing
+                self._record_job_result(job_id, "processing")
+
+                # Persist the processing transition: it is part of the
+                # documented status contract, and API clients in other
+                # processes filter and poll on it
                 job.status = "processing"
                 db.commit()
 
@@ -364,15 +430,21 @@ class PrinterService:
                 job.completed_at = datetime.utcnow()
                 db.commit()
 
+                self._record_job_result(job_id, "success")
+
         except Exception as e:
+            # Discard any uncommitted state before recording the failure
+            db.rollback()
+
             # Update status to failed
-            job = db.query(DingJob).filter(DingJob.id == job_id).first()
+            job = db.get(DingJob, job_id)
             if job:
                 job.status = "failed"
                 job.error_message = str(e)
                 job.completed_at = datetime.utcnow()
                 db.commit()
 
+            self._record_job_result(job_id, "failed", str(e))
             print(f"❌ Job {job_id} failed: {e}")
 
         finally:
@@ -392,3 +464,7 @@ class PrinterService:
 
 # Global printer service instance
 printer_service = PrinterService()
+
+# Forked workers must not share the parent's USB handle or lock
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=printer_service._reset_after_fork)
@@ -1,9 +1,6 @@
 """Text processing service for emoji conversion and cowsay generation."""
-import emoji
-import subprocess
 import textwrap
-import shutil
-import os
+from functools import lru_cache
 from typing import Optional
 from unidecode import unidecode
 
@@ -18,6 +15,8 @@ def convert_emojis_to_text(text: str) -> str:
     Returns:
         Text with emojis converted to text (e.g., 😀 -> :grinning_face:)
     """
+    # Imported on first use so ASCII-only prints never load the emoji data
+    import emoji
     return emoji.demojize(text)
 
 
@@ -32,6 +31,11 @@ def encode_for_escpos(text: str) -> str:
     Returns:
         ESC/POS compatible text
     """
+    # Fast path: pure-ASCII text has no emojis or special characters,
+    # so skip demojize and unidecode entirely (isascii is a single C pass)
+    if text.isascii():
+        return text
+
     # First convert emojis to text
     text = convert_emojis_to_text(text)
 
@@ -39,6 +43,17 @@ def encode_for_escpos(text: str) -> str:
     return unidecode(text)
 
 
+@lru_cache(maxsize=8)
+def _get_wrapper(max_width: int) -> textwrap.TextWrapper:
+    """Get a reusable TextWrapper for the given width.
+
+    textwrap.fill builds a fresh TextWrapper (and its regexes) on every
+    call; there are only a handful of configured widths, so cache one
+    instance per width.
+    """
+    return textwrap.TextWrapper(width=max_width)
+
+
 def wrap_text_for_printer(text: str, max_width: int) -> str:
     """
     Wrap text for printer based on character limit per line.
@@ -50,84 +65,69 @@ def wrap_text_for_printer(text: str, max_width: int) -> str:
     Returns:
         Wrapped text
     """
+    wrapper = _get_wrapper(max_width)
     lines = []
     for paragraph in text.split('\n'):
         if paragraph.strip():
-            wrapped = textwrap.fill(paragraph, width=max_width)
-            lines.append(wrapped)
+            lines.append(wrapper.fill(paragraph))
         else:
             lines.append('')
 
     return '\n'.join(lines)
 
 
-def find_cowsay_command() -> Optional[str]:
-    """
-    Find cowsay command in system PATH and common locations.
+def _reanchor_cow(art: str, indent: int = 4) -> str:
+    """Shift the cow art to a fixed small indent below the bubble.
 
-    Returns:
-        Full path to cowsay executable or None if not found
+    The cowsay library anchors the cow under the right edge of the
+    speech bubble, so wide bubbles push the art past the printer's line
+    width and the hard wrap mangles it. Dedenting the block below the
+    bubble keeps every art line within the cow's own width plus the
+    indent, like the old ``cowsay -W`` binary output.
     """
-    # Try shutil.which first (searches PATH)
-    cowsay_path = shutil.which('cowsay')
-    if cowsay_path:
-        return cowsay_path
-
-    # Check common locations where cowsay might be installed
-    # Use file existence check instead of running commands
-    common_paths = [
-        '/usr/games/cowsay',
-        '/usr/local/bin/cowsay',
-        '/usr/bin/cowsay',
-        '/bin/cowsay',
-    ]
+    lines = art.split('\n')
 
-    for path in common_paths:
-        if os.path.isfile(path) and os.access(path, os.X_OK):
-            return path
-
-    return None
+    # The bubble's bottom border is a line of '=' characters
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped and set(stripped) == {'='}:
+            break
+    else:
+        return art
+
+    tail = lines[i + 1:]
+    margin = min(
+        (len(l) - len(l.lstrip()) for l in tail if l.strip()),
+        default=0
+    )
+    shift = max(margin - indent, 0)
+    lines[i + 1:] = [l[shift:] if l.strip() else l for l in tail]
+    return '\n'.join(lines)
 
 
 def generate_cowsay(text: str, max_width: int) -> Optional[str]:
     """
-    Generate cowsay output for text.
+    Generate cowsay output for text using the in-process cowsay library.
+
+    Avoids forking the system cowsay binary per job (and the system
+    package dependency that came with it).
 
     Args:
         text: Text to convert to cowsay
         max_width: Maximum width for cowsay text bubble
 
     Returns:
-        Cowsay output or None if cowsay command fails
+        Cowsay output or None if generation fails
     """
     try:
-        # Find cowsay command
-        cowsay_cmd = find_cowsay_command()
-        if not cowsay_cmd:
-            print("❌ Cowsay command not found. Please install cowsay: sudo apt install cowsay")
-            print("   Common locations checked: /usr/games/cowsay, /usr/bin/cowsay, /usr/local/bin/cowsay")
-            return None
-
-        # Encode text for printing first
-        encoded_text = encode_for_escpos(text)
+        import cowsay
 
-        # Run cowsay command with full path
-        result = subprocess.run(
-            [cowsay_cmd, '-W', str(max_width), encoded_text],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        # Encode and wrap text first; the library doesn't wrap on its own
+        encoded_text = encode_for_escpos(text)
+        wrapped_text = wrap_text_for_printer(encoded_text, max_width)
 
-        if result.returncode == 0:
-            return result.stdout
-        else:
-            print(f"⚠️  Cowsay command failed: {result.stderr}")
-            return None
+        return _reanchor_cow(cowsay.get_output_string('cow', wrapped_text))
 
-    except subprocess.TimeoutExpired:
-        print("⚠️  Cowsay command timed out")
-        return None
     except Exception as e:
         print(f"❌ Error generating cowsay: {e}")
         return None
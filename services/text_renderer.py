@@ -1,19 +1,13 @@
 """Text rendering service for converting text to images (banner mode)."""
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 from typing import Optional
 
 
-def find_monospace_font(size: int) -> ImageFont.FreeTypeFont:
-    """
-    Find and load a monospace font.
-
-    Args:
-        size: Font size in pixels
-
-    Returns:
-        ImageFont object
-    """
+@lru_cache(maxsize=1)
+def _discover_font_path() -> Optional[str]:
+    """Locate a monospace font file, scanning the filesystem only once."""
     # Common monospace font paths on Linux
     font_paths = [
         "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
@@ -26,70 +20,128 @@ def find_monospace_font(size: int) -> ImageFont.FreeTypeFont:
 
     for font_path in font_paths:
         if Path(font_path).exists():
-            try:
-                return ImageFont.truetype(font_path, size)
-            except Exception as e:
-                print(f"⚠️  Failed to load font {font_path}: {e}")
-                continue
+            return font_path
+
+    return None
+
+
+@lru_cache(maxsize=64)
+def find_monospace_font(size: int) -> ImageFont.FreeTypeFont:
+    """
+    Find and load a monospace font.
+
+    Both the path discovery and the parsed font are cached: the font
+    size search calls this dozens of times per banner, and re-parsing
+    the TTF through FreeType on each call dominated render time.
+
+    Args:
+        size: Font size in pixels
+
+    Returns:
+        ImageFont object
+    """
+    font_path = _discover_font_path()
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size)
+        except Exception as e:
+            print(f"⚠️  Failed to load font {font_path}: {e}")
 
     # Fallback to default PIL font
     print("⚠️  No monospace font found, using default")
     return ImageFont.load_default()
 
 
-def calculate_font_size(text: str, target_height: int, max_iterations: int = 20) -> int:
+@lru_cache(maxsize=128)
+def calculate_font_size(text: str, target_height: int) -> int:
     """
     Calculate optimal font size to fill target height.
 
+    Memoized: the same text at the same target height always yields the
+    same size, and the UI re-asks on every rerun.
+
+    Rendered TrueType text height scales nearly linearly with font
+    size, so one measurement at a reference size gives the answer by
+    scaling — no binary search over font loads and measurements.
+
     Args:
         text: Text to render
         target_height: Target height in pixels (70% of dots_per_line)
-        max_iterations: Maximum number of binary search iterations
 
     Returns:
         Optimal font size
     """
-    # Binary search for optimal font size
-    min_size = 10
-    max_size = 500
-    best_size = 50
+    reference_size = 100
+
+    # getbbox reads FreeType metric tables directly — no dummy image,
+    # no ImageDraw object, no glyph rasterization
+    bbox = find_monospace_font(reference_size).getbbox(text)
+    reference_height = bbox[3] - bbox[1]
+    if reference_height <= 0:
+        return 50
+
+    size = max(10, int(reference_size * target_height / reference_height))
 
-    for _ in range(max_iterations):
-        mid_size = (min_size + max_size) // 2
-        font = find_monospace_font(mid_size)
+    # Linearity is approximate: verify once and nudge down if the
+    # rounded size overshoots the target height
+    bbox = find_monospace_font(size).getbbox(text)
+    while size > 10 and bbox[3] - bbox[1] > target_height:
+        size -= 1
+        bbox = find_monospace_font(size).getbbox(text)
 
-        # Get text bounding box
-        dummy_img = Image.new('RGB', (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_height = bbox[3] - bbox[1]
+    return size
 
-        if text_height < target_height:
-            min_size = mid_size + 1
-            best_size = mid_size
-        elif text_height > target_height:
-            max_size = mid_size - 1
-        else:
-            return mid_size
 
-    return best_size
+@lru_cache(maxsize=4)
+def _glyph_atlas(font_size: int):
+    """Pre-rendered printable-ASCII glyph cells at the given font size.
+
+    Monospace glyphs share one advance width, so a banner can be
+    composed by pasting cached cells instead of running FreeType layout
+    and rasterization for every banner at the same size. Returns
+    (glyphs, advance, line_height), or None when the fallback bitmap
+    font is in use.
+
+    Args:
+        font_size: Font size in pixels
+
+    Returns:
+        Tuple of (char -> L-mode Image, advance width, line height)
+    """
+    font = find_monospace_font(font_size)
+    try:
+        advance = int(font.getlength("M"))
+        ascent, descent = font.getmetrics()
+    except AttributeError:
+        return None
+    if advance <= 0:
+        return None
+
+    line_height = ascent + descent
+    glyphs = {}
+    for code in range(32, 127):
+        char = chr(code)
+        cell = Image.new('L', (advance, line_height), 255)
+        ImageDraw.Draw(cell).text((0, 0), char, fill=0, font=font)
+        glyphs[char] = cell
+    return glyphs, advance, line_height
 
 
 def render_text_banner(
     text: str,
-    output_path: str,
+    output_path: Optional[str] = None,
     dots_per_line: int = 384
-) -> str:
+) -> Image.Image:
     """
     Render text as a horizontal image for banner printing.
 
     Args:
         text: Text to render (single line)
-        output_path: Path to save rendered image
+        output_path: Optional path to also save the rendered image
         dots_per_line: Printer width in dots
 
     Returns:
-        Path to rendered image
+        Rendered 1-bit PIL Image
 
     Raises:
         ValueError: If text is empty or rendering fails
@@ -102,70 +154,91 @@ def render_text_banner(
 
     # Calculate optimal font size
     font_size = calculate_font_size(text, target_height)
-    font = find_monospace_font(font_size)
 
     print(f"  🎨 Rendering banner with font size: {font_size}px")
 
-    # Create dummy image to measure text dimensions
-    dummy_img = Image.new('RGB', (1, 1))
-    draw = ImageDraw.Draw(dummy_img)
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-
     # Add small margins
     margin_x = 20
-    margin_y = (dots_per_line - text_height) // 2
-
-    # Create final image
-    img_width = text_width + (2 * margin_x)
     img_height = dots_per_line
 
-    image = Image.new('RGB', (img_width, img_height), color='white')
-    draw = ImageDraw.Draw(image)
-
-    # Draw text in black, centered vertically
-    draw.text((margin_x, margin_y), text, fill='black', font=font)
-
-    # Convert to black & white (1-bit) for thermal printer
-    image = image.convert('1')
-
-    # Save image
-    image.save(output_path)
+    atlas = _glyph_atlas(font_size) if text.isascii() and text.isprintable() else None
+
+    if atlas:
+        # Compose from the pre-rendered glyph cells: after the first
+        # banner at this size, rendering is pure pastes with no
+        # FreeType work at all
+        glyphs, advance, line_height = atlas
+        img_width = advance * len(text) + (2 * margin_x)
+        margin_y = (dots_per_line - line_height) // 2
+
+        image = Image.new('L', (img_width, img_height), 255)
+        for i, char in enumerate(text):
+            image.paste(glyphs[char], (margin_x + i * advance, margin_y))
+    else:
+        # Non-ASCII text or bitmap fallback font: render through
+        # FreeType in one pass, sized via metric lookup
+        font = find_monospace_font(font_size)
+        left, top, right, bottom = font.getbbox(text)
+        text_width = right - left
+        text_height = bottom - top
+        img_width = text_width + (2 * margin_x)
+        margin_y = (dots_per_line - text_height) // 2
+
+        # Single-channel canvas: one byte per pixel instead of three,
+        # so the fill, the glyph draw and the 1-bit conversion all
+        # touch a third of the memory an RGB intermediate would
+        image = Image.new('L', (img_width, img_height), 255)
+        draw = ImageDraw.Draw(image)
+
+        # Draw text in black, centered vertically; offset by the bbox
+        # origin so the ink lands exactly inside the margins
+        draw.text((margin_x - left, margin_y - top), text, fill=0, font=font)
+
+    # Convert to black & white (1-bit) for thermal printer; the text is
+    # already pure black-on-white, so dithering would only add noise.
+    # With dither off, Pillow thresholds and bit-packs the L buffer in
+    # a single C pass
+    image = image.convert('1', dither=Image.Dither.NONE)
+
+    # Save only when a path is given; printing works straight from memory
+    if output_path:
+        image.save(output_path)
 
     print(f"  ✅ Banner rendered: {img_width}x{img_height} px")
     print(f"     Text: '{text}' ({len(text)} chars)")
 
-    return output_path
+    return image
 
 
+@lru_cache(maxsize=8)
 def get_banner_char_limit(dots_per_line: int = 384) -> int:
     """
     Estimate maximum characters for banner mode.
 
+    Memoized per printer width; the answer never changes at runtime.
+
     Args:
         dots_per_line: Printer width in dots
 
     Returns:
         Approximate maximum characters
     """
-    # Very rough estimate: ~30 pixels per character at optimal size
-    # This is conservative to ensure text fits
     target_height = int(dots_per_line * 0.7)
-    font_size = calculate_font_size("M", target_height)  # Use 'M' as reference
 
-    # Test with sample text
-    font = find_monospace_font(font_size)
-    dummy_img = Image.new('RGB', (1, 1))
-    draw = ImageDraw.Draw(dummy_img)
+    # Metric-only estimate: monospace advance width and glyph height
+    # both scale linearly with font size, so one getbbox/getlength at a
+    # reference size gives the char width at the banner size without
+    # sizing a font or rasterizing anything
+    font = find_monospace_font(100)
+    bbox = font.getbbox("M")
+    char_height = bbox[3] - bbox[1]
+    char_width = font.getlength("M")
+    if char_height <= 0 or char_width <= 0:
+        return 50
 
-    # Measure single character
-    bbox = draw.textbbox((0, 0), "M", font=font)
-    char_width = bbox[2] - bbox[0]
+    char_width_at_target = char_width * (target_height / char_height)
 
     # Maximum banner length (conservative estimate)
     # Assume maximum print length of ~10x printer width
     max_length_pixels = dots_per_line * 10
-    max_chars = int(max_length_pixels / char_width) if char_width > 0 else 50
-
-    return max_chars
+    return int(max_length_pixels / char_width_at_target)
@@ -15,23 +15,6 @@ if [ $? -ne 0 ]; then
     exit 1
 fi
 
-# Check for cowsay
-echo ""
-echo "Checking for cowsay..."
-if ! command -v cowsay &> /dev/null; then
-    echo "⚠️  cowsay not found. Installing..."
-    if command -v apt &> /dev/null; then
-        sudo apt install -y cowsay
-    elif command -v brew &> /dev/null; then
-        brew install cowsay
-    else
-        echo "❌ Please install cowsay manually: sudo apt install cowsay"
-        exit 1
-    fi
-else
-    echo "✅ cowsay found"
-fi
-
 # Create virtual environment if it doesn't exist
 if [ ! -d ".venv" ]; then
     echo ""
@@ -6,11 +6,12 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import time
+
 import streamlit as st
-from datetime import datetime, timedelta
 
 from core.database import get_db
-from core.security import validate_session, get_session_expiry
+from core.security import validate_session_with_expiry
 from core.config import settings
 
 # Page config
@@ -21,11 +22,20 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Load custom CSS
-css_path = Path(__file__).parent / "styles" / "retro.css"
-if css_path.exists():
-    with open(css_path) as f:
-        st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+@st.cache_data
+def _retro_css_block() -> str:
+    """Build the <style> block once; reruns reuse the cached string."""
+    css_path = Path(__file__).parent / "styles" / "retro.css"
+    if css_path.exists():
+        return f"<style>{css_path.read_text()}</style>"
+    return ""
+
+
+# Inject custom CSS (every rerun re-renders the DOM, but the disk read
+# and string assembly happen only on the first run)
+_css_block = _retro_css_block()
+if _css_block:
+    st.markdown(_css_block, unsafe_allow_html=True)
 
 
 def check_session():
@@ -33,16 +43,23 @@ def check_session():
     if "session_token" not in st.session_state:
         return None
 
+    timeout_minutes = int(st.session_state.get("session_timeout_minutes", 180))
+
     db = next(get_db())
-    user = validate_session(
+    validated = validate_session_with_expiry(
         db=db,
         session_token=st.session_state.session_token,
         extend=True,
-        timeout_minutes=int(st.session_state.get("session_timeout_minutes", 180))
+        timeout_minutes=timeout_minutes
     )
 
     # Extract user data before closing session
-    if user:
+    if validated:
+        user, _expires_at = validated
+        # The session was just extended, so the monotonic deadline is
+        # simply timeout from now; the timer reads this without any
+        # DB access or datetime arithmetic
+        st.session_state.session_expiry_monotonic = time.monotonic() + timeout_minutes * 60
         user_data = {
             "id": user.id,
             "username": user.username,
@@ -61,13 +78,11 @@ def show_session_timer(user):
     if "session_token" not in st.session_state:
         return
 
-    db = next(get_db())
-    expires_at = get_session_expiry(db, st.session_state.session_token)
-    db.close()
+    # Deadline kept as a monotonic timestamp by check_session/login
+    deadline = st.session_state.get("session_expiry_monotonic")
 
-    if expires_at:
-        time_left = expires_at - datetime.utcnow()
-        minutes_left = int(time_left.total_seconds() / 60)
+    if deadline is not None:
+        minutes_left = int((deadline - time.monotonic()) / 60)
 
         # Show warning if less than 5 minutes
         warning_minutes = int(st.session_state.get("session_warning_minutes", 5))
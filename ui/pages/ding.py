@@ -1,9 +1,12 @@
 """Main ding page for sending messages and images to printer."""
+import shutil
 import streamlit as st
-import time
+from streamlit_autorefresh import st_autorefresh
 from pathlib import Path
 from datetime import datetime
 
+from sqlalchemy import func
+
 from core.database import get_db
 from core.models import DingJob
 from core.config import settings
@@ -13,6 +16,28 @@ from services.printer import printer_service
 from services.text_renderer import get_banner_char_limit
 
 
+@st.cache_data
+def _banner_limit(dots_per_line: int) -> int:
+    """Cache the banner char limit across reruns (constant per width)."""
+    return get_banner_char_limit(dots_per_line)
+
+
+@st.cache_data
+def _dots_per_line() -> int:
+    """Printer width is fixed for the process; cache across reruns."""
+    return yaml_config.get_int("printer.dots_per_line", 384)
+
+
+@st.cache_data
+def _font_limits() -> dict:
+    """Per-(font size, format) character limits, loaded once."""
+    return {
+        (size, prefix): yaml_config.get_int(f"fonts.{size}.{prefix}_chars_per_line", 32)
+        for size in ("small", "medium", "large")
+        for prefix in ("text", "cowsay")
+    }
+
+
 def show_ding_page():
     """Display main ding page."""
     # Header
@@ -35,6 +60,11 @@ def show_ding_page():
     with tab2:
         show_image_tab()
 
+    # Active job status, refreshed by the Streamlit scheduler
+    if "active_job_id" in st.session_state:
+        st.markdown("---")
+        show_job_status(st.session_state.active_job_id)
+
     # Show recent jobs
     st.markdown("---")
     show_recent_jobs()
@@ -83,16 +113,14 @@ def show_text_tab():
     # Character counter
     if font_size == "banner":
         # Get banner character limit
-        dots_per_line = yaml_config.get_int("printer.dots_per_line", 384)
-        max_chars = get_banner_char_limit(dots_per_line)
+        max_chars = _banner_limit(_dots_per_line())
         char_count = len(text_content)
         st.caption(f"Characters: {char_count} (max ~{max_chars} for banner)")
         if char_count > max_chars:
             st.warning(f"⚠️ Text may be too long for banner mode (max ~{max_chars} chars)")
     else:
         prefix = "cowsay" if use_cowsay else "text"
-        config_key = f"fonts.{font_size}.{prefix}_chars_per_line"
-        max_chars = yaml_config.get_int(config_key, 32)
+        max_chars = _font_limits()[(font_size, prefix)]
         char_count = len(text_content)
         st.caption(f"Characters: {char_count} (approx. {max_chars} chars per line)")
 
@@ -125,8 +153,8 @@ def show_text_tab():
 
         st.success(f"✅ Job #{job_id} submitted!")
 
-        # Show job status
-        show_job_status(job_id)
+        # Status renders below the tabs and refreshes itself
+        st.session_state.active_job_id = job_id
 
 
 def show_image_tab():
@@ -178,8 +206,11 @@ def show_image_tab():
             filename = f"{st.session_state.user['username']}_{timestamp}_{uploaded_file.name}"
             file_path = settings.store_path / filename
 
+            # Stream in 1 MB chunks instead of materializing a second
+            # full copy of the upload in memory
+            uploaded_file.seek(0)
             with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
+                shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
 
             # Validate image
             if not validate_image(str(file_path)):
@@ -213,66 +244,93 @@ def show_image_tab():
 
             st.success(f"✅ Job #{job_id} submitted!")
 
-            # Show job status
-            show_job_status(job_id)
+            # Status renders below the tabs and refreshes itself
+            st.session_state.active_job_id = job_id
 
 
 def show_job_status(job_id: int, max_wait: int = 30):
     """
-    Show real-time job status with polling.
+    Show real-time job status, refreshed by the Streamlit runtime.
+
+    st_autorefresh schedules one rerun per second (up to max_wait)
+    instead of holding the script thread in a sleep loop, so the worker
+    stays free and each tick costs a single job SELECT.
 
     Args:
         job_id: Job ID to monitor
         max_wait: Maximum seconds to wait
     """
-    status_placeholder = st.empty()
-    progress_bar = st.progress(0)
-
-    start_time = time.time()
-    poll_interval = 1  # seconds
+    count = st_autorefresh(interval=1000, limit=max_wait, key=f"job_refresh_{job_id}")
 
-    while time.time() - start_time < max_wait:
-        # Get job status
+    # Fast path: the printer worker runs in this process and records
+    # results in memory, so status ticks normally skip the DB entirely
+    result = printer_service.get_job_result(job_id)
+    if result is not None:
+        status, error_message = result
+    else:
+        # Get job status (job was queued by another process)
         db = next(get_db())
-        job = db.query(DingJob).filter(DingJob.id == job_id).first()
+        job = db.get(DingJob, job_id)
         db.close()
 
         if not job:
-            status_placeholder.error("❌ Job not found")
-            break
-
-        # Update progress
-        elapsed = time.time() - start_time
-        progress = min(elapsed / max_wait, 1.0)
-        progress_bar.progress(progress)
-
-        # Display status
-        if job.status == "pending":
-            status_placeholder.info("⏳ Waiting to process...")
-        elif job.status == "processing":
-            status_placeholder.info("🖨️ Printing...")
-        elif job.status == "success":
-            status_placeholder.success("✅ Successfully printed!")
-            progress_bar.progress(1.0)
-            break
-        elif job.status == "failed":
-            status_placeholder.error(f"❌ Failed: {job.error_message}")
-            progress_bar.progress(1.0)
-            break
-
-        time.sleep(poll_interval)
+            st.error("❌ Job not found")
+            st.session_state.pop("active_job_id", None)
+            return
+
+        status, error_message = job.status, job.error_message
+
+    # Display status; terminal states stop the refresh cycle
+    if status == "success":
+        st.progress(1.0)
+        st.success("✅ Successfully printed!")
+        printer_service.clear_job_result(job_id)
+        st.session_state.pop("active_job_id", None)
+        return
 
+    if status == "failed":
+        st.progress(1.0)
+        st.error(f"❌ Failed: {error_message}")
+        printer_service.clear_job_result(job_id)
+        st.session_state.pop("active_job_id", None)
+        return
+
+    st.progress(min((count + 1) / max_wait, 1.0))
+    if status == "processing":
+        st.info("🖨️ Printing...")
     else:
+        st.info("⏳ Waiting to process...")
+
+    if count >= max_wait - 1:
         # Timeout
-        status_placeholder.warning("⚠️ Status check timed out. Job is still processing in background.")
+        st.warning("⚠️ Status check timed out. Job is still processing in background.")
+        st.session_state.pop("active_job_id", None)
 
 
+@st.fragment(run_every=30)
 def show_recent_jobs():
-    """Show recent jobs for current user."""
+    """Show recent jobs for current user.
+
+    Runs as a fragment: keystrokes elsewhere on the page no longer
+    re-execute this query, and the list refreshes itself every 30s.
+    """
     st.markdown("### 📋 Recent Dings")
 
+    # Select only the displayed columns; text_content is truncated
+    # server-side to the 100 chars the UI shows (plus one to detect
+    # overflow), so long messages never cross the wire
     db = next(get_db())
-    jobs = db.query(DingJob).filter(
+    jobs = db.query(
+        DingJob.id,
+        DingJob.job_type,
+        DingJob.content_type,
+        DingJob.status,
+        DingJob.created_at,
+        DingJob.font_size,
+        DingJob.completed_at,
+        func.substr(DingJob.text_content, 1, 101).label("text_content"),
+        DingJob.error_message
+    ).filter(
         DingJob.user_id == st.session_state.user["id"]
     ).order_by(DingJob.created_at.desc()).limit(5).all()
     db.close()
@@ -1,12 +1,41 @@
 """Login page for DING Streamlit UI."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
-from datetime import datetime
 
 from core.database import get_db
 from core.models import User, AppConfig
 from core.security import create_pin_for_user, validate_pin, can_request_pin, create_session
 from services.email import send_pin_email
 
+# SMTP round-trips take 0.5-3s; sending off-thread keeps the click
+# handler responsive
+_email_executor = ThreadPoolExecutor(max_workers=4)
+
+_LOGIN_CONFIG_KEYS = (
+    "pin_rate_limit_minutes",
+    "pin_expiry_minutes",
+    "session_timeout_minutes",
+    "session_warning_minutes",
+)
+
+
+@st.cache_data(ttl=300)
+def _login_config() -> dict:
+    """Fetch the login-related AppConfig rows in a single query.
+
+    Cached for five minutes: these values change rarely and only via
+    the admin API, and the cache turns four per-login queries into
+    none once warm.
+    """
+    db = next(get_db())
+    rows = db.query(AppConfig.key, AppConfig.value).filter(
+        AppConfig.key.in_(_LOGIN_CONFIG_KEYS)
+    ).all()
+    db.close()
+    return dict(rows)
+
 
 def show_login_page():
     """Display login page."""
@@ -75,8 +104,8 @@ def show_username_step():
                 return
 
             # Check rate limit
-            config = db.query(AppConfig).filter(AppConfig.key == "pin_rate_limit_minutes").first()
-            rate_limit_minutes = int(config.value) if config else 1
+            cfg = _login_config()
+            rate_limit_minutes = int(cfg.get("pin_rate_limit_minutes", 1))
 
             if not can_request_pin(db, user.id, rate_limit_minutes):
                 db.close()
@@ -84,24 +113,23 @@ def show_username_step():
                 return
 
             # Get PIN expiry config
-            config = db.query(AppConfig).filter(AppConfig.key == "pin_expiry_minutes").first()
-            pin_expiry_minutes = int(config.value) if config else 10
+            pin_expiry_minutes = int(cfg.get("pin_expiry_minutes", 10))
 
             # Create PIN
             pin = create_pin_for_user(db, user.id, pin_expiry_minutes)
 
-            # Send email
-            email_sent = send_pin_email(user.email, pin, user.username)
+            # Send the email in the background and advance optimistically;
+            # the PIN step surfaces a failure if the send comes back False
+            st.session_state.pin_email_future = _email_executor.submit(
+                send_pin_email, user.email, pin, user.username
+            )
 
             db.close()
 
-            if email_sent:
-                st.session_state.login_username = username
-                st.session_state.login_step = "pin"
-                st.session_state.pin_sent_message = f"✅ PIN sent to {user.email}"
-                st.rerun()
-            else:
-                st.error("❌ Failed to send PIN email. Please try again.")
+            st.session_state.login_username = username
+            st.session_state.login_step = "pin"
+            st.session_state.pin_sent_message = f"✅ PIN sent to {user.email}"
+            st.rerun()
 
         # Show message if any
         if st.session_state.pin_sent_message:
@@ -116,6 +144,13 @@ def show_pin_step():
         st.markdown(f"### 🔐 Enter PIN")
         st.info(f"📧 PIN sent to the email registered for **{st.session_state.login_username}**")
 
+        # Surface a failure from the background email send
+        email_future = st.session_state.get("pin_email_future")
+        if email_future is not None and email_future.done():
+            if not email_future.result():
+                st.error("❌ Failed to send PIN email. Please go back and try again.")
+            st.session_state.pin_email_future = None
+
         pin = st.text_input(
             "4-Digit PIN",
             max_chars=4,
@@ -150,13 +185,10 @@ def show_pin_step():
                     st.error("❌ Invalid or expired PIN")
                     return
 
-                # Get session timeout config
-                config = db.query(AppConfig).filter(AppConfig.key == "session_timeout_minutes").first()
-                session_timeout = int(config.value) if config else 180
-
-                # Get session warning config
-                config = db.query(AppConfig).filter(AppConfig.key == "session_warning_minutes").first()
-                session_warning = int(config.value) if config else 5
+                # Get session timeout and warning config
+                cfg = _login_config()
+                session_timeout = int(cfg.get("session_timeout_minutes", 180))
+                session_warning = int(cfg.get("session_warning_minutes", 5))
 
                 # Create session
                 session_token = create_session(db, user.id, session_timeout)
@@ -174,6 +206,7 @@ def show_pin_step():
                 # Store in session state
                 st.session_state.session_token = session_token
                 st.session_state.session_timeout_minutes = session_timeout
+                st.session_state.session_expiry_monotonic = time.monotonic() + session_timeout * 60
                 st.session_state.session_warning_minutes = session_warning
                 st.session_state.user = user_data
 